@@ -336,9 +336,10 @@ def virtualSDSPage_2DGaussian(proteins=Protein.getAllProteins(),
             convertBinsToPlottableEvents to be defined and available.
         Performance
         -----------
-        - Time complexity is O(N_bands * Nx * Ny) in the worst case because for each
-            band an Ny-by-Nx outer-product blob is computed (implemented as
-            outer(gy, gx) which is Ny*Nx work per band). Memory usage is dominated by
+        - Time complexity is O(N_bands * Nx + Nx * Ny). All bands share the vertical
+            profile gy >= 0, so the per-band horizontal profiles are blended first
+            (max or sum over bands) and expanded with a single outer(gy, profile)
+            instead of building an Ny-by-Nx blob per band. Memory usage is dominated by
             the Ny x Nx float arrays (I and later RGB).
         - To improve performance for many bands or high resolution:
             - Reduce Ny and/or Nx.
@@ -420,31 +421,30 @@ def virtualSDSPage_2DGaussian(proteins=Protein.getAllProteins(),
         # Simple linear mapping - matplotlib will apply log scaling via set_xscale('log')
         t = (w - xmin) / (xmax - xmin)
         t = np.clip(t, 0, 1)
-        return int(np.round(t * (Nx - 1)))
+        return np.round(t * (Nx - 1))
 
     I = np.zeros((Ny, Nx), dtype=float)
 
     ycenter = 0.5  # (currently unused; you could vary centers with abundance)
 
-    # === draw each band using abundance-based amplitudes ===
+    # === draw all bands using abundance-based amplitudes ===
     if has_events:
-        for w, A in zip(weights, abundances):
-            j = to_col(w)
-            xgrid = np.arange(Nx)
-            ygrid = y
-
-            w_ref = 50.0
-            beta = 0.4
-            sigma_w = sigma_x_px * (w / w_ref)**beta
-
-            gx = np.exp(-0.5 * ((xgrid - j) / sigma_w)**2)
-            gy = np.exp(-0.5 * (np.abs((y - 0.5) / sigma_y_frac) ** (2 * order_y)))
-            blob = A * np.outer(gy, gx)
-
-            if blend == 'max':
-                I = np.maximum(I, blob)
-            else:
-                I += blob
+        w_ref = 50.0
+        beta = 0.4
+        cols = to_col(weights)
+        sigma_w = sigma_x_px * (weights / w_ref)**beta
+
+        # One horizontal profile per band (bands x Nx) and a single vertical profile shared by all bands
+        gx = np.exp(-0.5 * ((xpix[np.newaxis, :] - cols[:, np.newaxis]) / sigma_w[:, np.newaxis])**2)
+        gy = np.exp(-0.5 * (np.abs((y - 0.5) / sigma_y_frac) ** (2 * order_y)))
+        bands = abundances[:, np.newaxis] * gx
+
+        # Blobs are separable (A * gy ⊗ gx) with gy >= 0, so blending the blobs equals
+        # blending the horizontal profiles first and taking one outer product
+        if blend == 'max':
+            I = np.maximum(I, np.outer(gy, bands.max(axis=0)))
+        else:
+            I += np.outer(gy, bands.sum(axis=0))
 
         if blend == 'sum':
             I = np.clip(I, 0, 1)
@@ -1,4 +1,5 @@
 import json
+import numpy as np
 from SDS.SDS_PAGE import getExampleSDS_PAGE,virtualSDSPage_2DGaussian,parseFasta
 from _EACH.protein import Protein
 from utils.helperFunctions import extractSetting
@@ -15,17 +16,11 @@ def select(moduleIdentifier,selectedSettings,moduleData):
     :param moduleData: Loaded JSON defining all modules and their settings (options, defaults, etc.).
     :return: SDS-PAGE plot generated from the proteins produced by the module.
     """
-    match moduleIdentifier:
-        case "fasta_input":
-            proteins = fasta_input(moduleIdentifier, selectedSettings, moduleData)
-            return virtualSDSPage_2DGaussian(proteins)
-        case "size_exclusion":
-            proteins = size_exclusion(moduleIdentifier, selectedSettings, moduleData)
-            return virtualSDSPage_2DGaussian(proteins)
-
-        case _: # Add new modules above 
-            # Do not add modules below
-            raise NotImplementedError(f"Module: {moduleIdentifier} is not implemented yet.")
+    moduleImplementation = MODULE_IMPLEMENTATIONS.get(moduleIdentifier)
+    if moduleImplementation is None:
+        raise NotImplementedError(f"Module: {moduleIdentifier} is not implemented yet.")
+    proteins = moduleImplementation(moduleIdentifier, selectedSettings, moduleData)
+    return virtualSDSPage_2DGaussian(proteins)
         
 
 def fasta_input(moduleIdentifier, selectedSettings,moduleData):
@@ -53,23 +48,6 @@ def size_exclusion(moduleIdentifier, selectedSettings, moduleData):
     sec_mode = extractSetting("SEC mode", moduleIdentifier, selectedSettings, moduleData)
     keepInsideOutside = "inside"
 
-    def _get_abundance(p):
-        if hasattr(p, "get_abundance") and callable(p.get_abundance):
-            return float(p.get_abundance() or 0.0)
-        return float(getattr(p, "abundance", 0.0) or 0.0)
-
-    def _get_weight_kda(p):
-        # prefer attribute used elsewhere in your codebase
-        w = getattr(p, "weight", None)
-        if w is not None:
-            return float(w)
-        # fallback if getter exists
-        if hasattr(p, "get_weight") and callable(p.get_weight):
-            gw = p.get_weight()
-            if gw is not None:
-                return float(gw)
-        return None
-
     def _apply_window(min_kda, max_kda, label=None):
         min_kda = float(min_kda)
         max_kda = float(max_kda)
@@ -105,23 +83,20 @@ def size_exclusion(moduleIdentifier, selectedSettings, moduleData):
             user_min, user_max = user_max, user_min
 
         options = moduleData[moduleIdentifier]["settings"]["SEC column"]["options"]  # label -> [min,max]
-        proteins = Protein.getAllProteins()
+        # Structure-of-arrays view of the proteome: one contiguous weight/abundance
+        # vector instead of per-protein attribute lookups inside the column loop.
+        weights, abundances = Protein.getAllProteinsAsArrays()
+        valid = (abundances > 0.0) & np.isfinite(weights)
+        weights = weights[valid]
+        abundances = abundances[valid]
+
+        # Sort once by weight; with cumulative abundances every window sum is two binary searches
+        order = np.argsort(weights, kind="stable")
+        weights = weights[order]
+        cumulative = np.concatenate(([0.0], np.cumsum(abundances[order])))
 
         def abundance_in_window(a, b):
-            a = float(a); b = float(b)
-            if a > b:
-                a, b = b, a
-            total = 0.0
-            for p in proteins:
-                ab = p.get_abundance()
-                if ab is None or ab <= 0.0:
-                    continue
-                w = p.get_weight()
-                if w is None:
-                    continue
-                if a <= w <= b:
-                    total += ab
-            return total
+            return float(cumulative[np.searchsorted(weights, b, side="right")] - cumulative[np.searchsorted(weights, a, side="left")])
 
         best_label = None
         best_col_min = None
@@ -139,10 +114,10 @@ def size_exclusion(moduleIdentifier, selectedSettings, moduleData):
             if eff_min > eff_max:
                 continue
 
-            in_target = abundance_in_window(eff_min, eff_max)     # proteins in the requested target slice
             in_column = abundance_in_window(col_min, col_max)     # proteins that the column would pass in total
             if in_column <= 0.0:
                 continue
+            in_target = abundance_in_window(eff_min, eff_max)     # proteins in the requested target slice
 
             score = in_target / in_column  # "portion" (purity) of target-range proteins in the column output
 
@@ -151,6 +126,9 @@ def size_exclusion(moduleIdentifier, selectedSettings, moduleData):
                 best_label = label
                 best_col_min = col_min
                 best_col_max = col_max
+                if score >= 1.0:
+                    # column passes only target-range proteins; no later column can beat it
+                    break
 
         if best_label is None:
             return Protein.getAllProteins()
@@ -159,3 +137,10 @@ def size_exclusion(moduleIdentifier, selectedSettings, moduleData):
         _apply_window(best_col_min, best_col_max, label=best_label)
         return Protein.getAllProteins()
 
+
+# Module id (from the module JSON) -> backend implementation returning the resulting proteins.
+# Add new modules here, below their function definitions.
+MODULE_IMPLEMENTATIONS = {
+    "fasta_input": fasta_input,
+    "size_exclusion": size_exclusion,
+}
@@ -1,4 +1,5 @@
 import os
+import numpy as np
 from Bio.Seq import Seq
 from Bio import SeqUtils
 from modules.signal import getSignalProteome
@@ -6,6 +7,56 @@ from Bio.SeqUtils.IsoelectricPoint import IsoelectricPoint
 # Config variables
 N_DIGITS_GLOBAL = 3
 
+
+class ProteinArrays:
+    """
+    Structure-of-arrays backing store for the numeric per-protein attributes (weight, abundance).
+
+    Every Protein owns one slot; the values live in contiguous float64 arrays so range
+    queries over the whole population are single vectorized NumPy operations. Capacity
+    grows by doubling. Slots of proteins that are not (or no longer) in the registry are
+    flagged in `registered` and excluded from population-wide queries; a replaced protein's
+    entry in `proteins` is cleared so the store does not keep it alive.
+
+    `proteins` holds the owning Protein of every slot and each Protein holds the store,
+    so registered proteins sit in a reference cycle that is reclaimed by the cyclic
+    garbage collector once the store is dropped (deleteAllProteins). A Protein whose
+    __init__ raises after allocating keeps its slot, unregistered, with the half-built
+    instance in `proteins` until the store is reset.
+    """
+
+    def __init__(self, capacity=1024):
+        self.size = 0
+        self.weights = np.full(capacity, np.nan, dtype=np.float64)
+        self.abundances = np.zeros(capacity, dtype=np.float64)
+        self.registered = np.zeros(capacity, dtype=bool)
+        self.proteins = []
+
+    def allocate(self, protein):
+        """
+        Reserve a slot for `protein` and return its index.
+
+        :param protein: Protein instance owning the slot.
+        :return: Integer slot index.
+        """
+        if self.size == len(self.weights):
+            capacity = 2 * len(self.weights)
+            self.weights = np.concatenate((self.weights, np.full(capacity - self.size, np.nan)))
+            self.abundances = np.concatenate((self.abundances, np.zeros(capacity - self.size)))
+            self.registered = np.concatenate((self.registered, np.zeros(capacity - self.size, dtype=bool)))
+        index = self.size
+        self.size += 1
+        self.proteins.append(protein)
+        return index
+
+    def view(self):
+        """
+        Return writable views (weights, abundances, registered) over the used slots.
+
+        :return: Tuple of three NumPy array views of length `size`.
+        """
+        return self.weights[:self.size], self.abundances[:self.size], self.registered[:self.size]
+
 class Protein:
     
     # ---------------------------- Static Global Variables  ------------------------
@@ -52,6 +103,9 @@ class Protein:
     
     masterProteomeID = None
     
+    # Weights and abundances of all proteins created since the last registry reset
+    attributeArrays = ProteinArrays()
+    
     # ------------------------------------------------------------------------------
     # ---------------------------- Static Global Variables  ------------------------
 
@@ -68,6 +122,21 @@ class Protein:
         """
         return list(Protein.childClasses.values())
     
+    @staticmethod
+    def getAllProteinsAsArrays():
+        """
+        Return weights and abundances of all tracked proteins as parallel NumPy arrays.
+
+        The values are read straight from the `attributeArrays` backing store, so no
+        per-protein attribute access is needed.
+
+        :return: Tuple (weights, abundances) of float64 arrays (copies) in creation order (the
+                 `childClasses` order unless an entry name was replaced).
+
+        """
+        weights, abundances, registered = Protein.attributeArrays.view()
+        return weights[registered], abundances[registered]
+    
     @staticmethod
     def deleteAllProteins():
         """
@@ -78,6 +147,7 @@ class Protein:
         """
         Protein.childClasses = {}
         Protein.masterProteomeID = None
+        Protein.attributeArrays = ProteinArrays()
     
     
     @staticmethod
@@ -114,19 +184,21 @@ class Protein:
             minWeight = float('inf')
         if maxWeight is None:
             maxWeight = -float('inf')
+        arrays = Protein.attributeArrays
+        weights, abundances, registered = arrays.view()
         if keepInsideOutsideSelection == "outside":    
-            for protein in Protein.childClasses.values():
-                if minWeight <= protein.get_weight() <= maxWeight:
-                    protein.abundance = 0.0
-                    protein.modifications.append(f"Removed due to weight outside range {minWeight}-{maxWeight} kDa")
+            removed = registered & (weights >= minWeight) & (weights <= maxWeight)
+            abundances[removed] = 0.0
+            for index in np.flatnonzero(removed):
+                arrays.proteins[index].modifications.append(f"Removed due to weight outside range {minWeight}-{maxWeight} kDa")
         elif keepInsideOutsideSelection == "inside":
-            for protein in Protein.childClasses.values():
-                if protein.get_weight() < minWeight:
-                    protein.abundance = 0.0
-                    protein.modifications.append(f"Removed due to weight < {minWeight} kDa")
-                if protein.get_weight() > maxWeight:
-                    protein.abundance = 0.0
-                    protein.modifications.append(f"Removed due to weight > {maxWeight} kDa")
+            below = registered & (weights < minWeight)
+            above = registered & (weights > maxWeight)
+            abundances[below | above] = 0.0
+            for index in np.flatnonzero(below):
+                arrays.proteins[index].modifications.append(f"Removed due to weight < {minWeight} kDa")
+            for index in np.flatnonzero(above):
+                arrays.proteins[index].modifications.append(f"Removed due to weight > {maxWeight} kDa")
                 
     @staticmethod
     def fractionateProteinsByIsoelectricPoint(keepInsideOutsideSelection="inside", minPI=None, maxPI=None):
@@ -253,13 +325,23 @@ class Protein:
 
         """
         
+        # Weight and abundance are stored in the class-level `attributeArrays` slot
+        self._arrays = Protein.attributeArrays
+        self._index = self._arrays.allocate(self)
         self.header = header
         self.sequence = Seq(sequence)
         # Set Weight and other sequence-dependent attributes
         self.setSequenceDependentAttributes()
         self.__processHeader()
         self.modifications = []
+        # A protein with the same entry name is replaced in place (keeping its registry position);
+        # unregister its slot so registry and arrays stay aligned
+        replacedProtein = Protein.childClasses.get(self.entryName)
+        if replacedProtein is not None:
+            replacedProtein._arrays.registered[replacedProtein._index] = False
+            replacedProtein._arrays.proteins[replacedProtein._index] = None
         Protein.childClasses[self.entryName] = self
+        self._arrays.registered[self._index] = True
         
     def __processHeader(self):
         """
@@ -456,6 +538,25 @@ class Protein:
         return "\n".join(fasta_lines)
     
     
+    # ------------------------- Array-backed attributes ----------------------------
+    # -------------------------------------------------------------------------------
+
+    @property
+    def weight(self):
+        return float(self._arrays.weights[self._index])
+
+    @weight.setter
+    def weight(self, weight):
+        self._arrays.weights[self._index] = weight
+
+    @property
+    def abundance(self):
+        return float(self._arrays.abundances[self._index])
+
+    @abundance.setter
+    def abundance(self, abundance):
+        self._arrays.abundances[self._index] = abundance
+
     # ------------------------------- Set Functions ---------------------------------
     # -------------------------------------------------------------------------------
 
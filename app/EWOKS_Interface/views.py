@@ -11,18 +11,22 @@ from django.views.generic import TemplateView
 from pathlib import Path
 import base64
 import _EACH.modules as EWOKS_modules
+from utils.helperFunctions import ModuleDefinitions
 import os
+import copy
+
+# Static placeholder SDS-PAGE images, encoded once; resolved relative to this app so the CWD does not matter
+_STATIC_IMG_DIR = Path(__file__).resolve().parent / 'static' / 'img'
+_EMPTY_SDS_BASE64 = base64.b64encode((_STATIC_IMG_DIR / 'emptySDS.png').read_bytes()).decode('utf-8')
+_NO_IMG_SDS_BASE64 = base64.b64encode((_STATIC_IMG_DIR / 'sdsNoImgSupplied.png').read_bytes()).decode('utf-8')
 
 # Create your views here.
 
 class IndexView(TemplateView):
     def get(self, request):
         moduleCardContent = self.POSTGET_get_modules()
-        img_path = Path('app/EWOKS_Interface/static/img/emptySDS.png')
-        with open(img_path, 'rb') as img_file:
-            emptySDS_base64 = base64.b64encode(img_file.read()).decode('utf-8')
         cardsToRender = [next((card for card in moduleCardContent if card.get('id') == 'fasta_input'), None)]
-        sdspageimg = [emptySDS_base64 for _ in cardsToRender]
+        sdspageimg = [_EMPTY_SDS_BASE64 for _ in cardsToRender]
         
         
         return render(request, 'EWOKS_main.html',
@@ -36,7 +40,13 @@ class IndexView(TemplateView):
     
     def POST_render_result(self, request, moduleOrder, instanceTypes, instanceSettings):
         sdsPageImages = []
-        moduleData = getModulesDictFromJsonFiles()
+        # Defaults are rewritten below for the modules in this workflow; copy only those and
+        # share the remaining cached definitions read-only
+        moduleTemplates = getModulesDictFromJsonFiles()
+        moduleData = moduleTemplates.copy()
+        for module in {instanceTypes.get(instanceId) for instanceId in moduleOrder}:
+            if module in moduleTemplates:
+                moduleData[module] = copy.deepcopy(moduleTemplates[module])
 
         cardsForRender = []
 
@@ -55,9 +65,7 @@ class IndexView(TemplateView):
 
             
             if not sdsPageImgBase64:
-                img_path = Path('app/EWOKS_Interface/static/img/sdsNoImgSupplied.png')
-                with open(img_path, 'rb') as img_file:
-                    sdsPageImgBase64 = base64.b64encode(img_file.read()).decode('utf-8')
+                sdsPageImgBase64 = _NO_IMG_SDS_BASE64
             
             sdsPageImages.append({
                 "img": sdsPageImgBase64,
@@ -87,19 +95,18 @@ class IndexView(TemplateView):
         instanceSettings = {}
         # Walk all POST keys; expect names like "<instanceId>:<setting>" and "ModuleType:<instanceId>"
         for key, values in request.POST.lists():
-            if key.startswith('ModuleType:'):
-                instanceId = key.split(':', 1)[1]
-                instanceTypes[instanceId] = values[0]
-            elif ':' in key and not key.startswith(('Field:', 'ModuleType:')):
-                instanceId, settingName = key.split(':', 1)
-                if len(values) > 1:
-                    instanceSettings.setdefault(instanceId, {})[settingName] = values
-                else:
-                    instanceSettings.setdefault(instanceId, {})[settingName] = values[0]
+            prefix, separator, remainder = key.partition(':')
+            if not separator or prefix == 'Field':
+                continue
+            if prefix == 'ModuleType':
+                instanceTypes[remainder] = values[0]
+            else:
+                instanceSettings.setdefault(prefix, {})[remainder] = values if len(values) > 1 else values[0]
         return moduleOrder, instanceTypes, instanceSettings
     
     def POSTGET_get_modules(self):
-        modules = getModulesDictFromJsonFiles()
+        # Shallow per-module copies: only top-level card keys are added here
+        modules = {moduleKey: dict(moduleValues) for moduleKey, moduleValues in getModulesDictFromJsonFiles().items()}
         for moduleKey, moduleValues in modules.items():
             moduleValues['form'] = construct_form(module=moduleValues)()
             # seed instance id = module key for initial render
@@ -110,16 +117,34 @@ class IndexView(TemplateView):
 
 
 
+# Parsed module definitions, keyed by directory and invalidated when any JSON file changes
+_MODULES_CACHE = {}
+
+
 def getModulesDictFromJsonFiles(moduleDirPath="_EACH/modules"):
+    """
+    Load and merge all module JSON definitions from `moduleDirPath`.
+
+    The merged dict is cached and only re-parsed when a JSON file is added, removed
+    or modified. The returned ModuleDefinitions carries the settings index used by
+    extractSetting and is shared between requests; callers that mutate it must work
+    on a copy.
+    """
+    jsonFiles = [os.path.join(moduleDirPath, f) for f in os.listdir(moduleDirPath) if f.endswith(".json")]
+    fingerprint = tuple((path, os.stat(path).st_mtime_ns) for path in jsonFiles)
+    cached = _MODULES_CACHE.get(moduleDirPath)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
     combinedModules = {}
-    for moduleJsonFile in os.listdir(moduleDirPath):
-        if not moduleJsonFile.endswith(".json"):
-            continue
-        with open(os.path.join(moduleDirPath,moduleJsonFile),'r') as f:
+    for moduleJsonFile in jsonFiles:
+        with open(moduleJsonFile,'r') as f:
             moduleData = json.load(f)
             combinedModules.update(moduleData)
     for k,v in combinedModules.items():
         if k != v.get("id"):
             raise SyntaxError(f"Module key '{k}' does not match module 'id' field '{v.get('id')}'.")
-    
-    return combinedModules
\ No newline at end of file
+
+    combinedModules = ModuleDefinitions(combinedModules)
+    _MODULES_CACHE[moduleDirPath] = (fingerprint, combinedModules)
+    return combinedModules
@@ -1,7 +1,7 @@
 import urllib.request
 from tqdm import tqdm
 import os
-import json
+import ijson
 
 
 def downloadSignalSequenceByProteome(proteomeIds=["UP000005640"],redownload=False):
@@ -10,9 +10,8 @@ def downloadSignalSequenceByProteome(proteomeIds=["UP000005640"],redownload=Fals
     proteome's JSON response to a local file.
     proteomeIds : list of str, optional
         List of UniProt proteome accessions to fetch (default ["UP000005640"] - Home Sapiens).
-        The function constructs a single UniProt query containing all IDs (formatted as
-        '(proteome:ID1 OR proteome:ID2 ...)') and sends one HTTP request for that combined
-        query. For each proteomeId in the provided list a separate output file is created
+        One UniProt query (formatted as '(proteome:ID)') and one HTTP request is sent per
+        proteomeId, and its response is saved to a separate output file
         (data/signalProteomes/{proteomeId}.json).
     redownload : bool, optional
         If False (default) the function will skip downloading for any proteomeId that
@@ -27,8 +26,8 @@ def downloadSignalSequenceByProteome(proteomeIds=["UP000005640"],redownload=Fals
     ------------
     - Performs an HTTP GET request to the UniProt REST API to retrieve the fields
       accession, id, and ft_signal in JSON format.
-    - Writes the raw JSON response (UTF-8 decoded) to data/signalProteomes/{proteomeId}.json
-      for each requested proteomeId.
+    - Streams the raw JSON response in 64 KiB chunks to data/signalProteomes/{proteomeId}.json
+      for each requested proteomeId; the body is never held in memory as a whole.
     - Displays console output and a tqdm progress bar while downloading.
     - May create or overwrite files under the data/signalProteomes/ directory.
     Notes
@@ -36,8 +35,8 @@ def downloadSignalSequenceByProteome(proteomeIds=["UP000005640"],redownload=Fals
     - The function relies on urllib.request to fetch data, tqdm for progress display, and os
       for filesystem checks; these should be imported in the module where the function is used.
     - If the HTTP response includes a Content-Length header, it is used to size the progress bar.
-    - The URL is constructed by joining the provided proteomeIds into a single query string;
-      this means one HTTP response is fetched per invocation and then saved to the per-proteome files.
+    - The URL is constructed per proteomeId, so each proteome is fetched exactly once and each
+      file only contains entries of its own proteome.
     - The saved files contain the JSON text returned by UniProt; no parsing of the JSON is performed
       before writing.
     Exceptions
@@ -58,33 +57,27 @@ def downloadSignalSequenceByProteome(proteomeIds=["UP000005640"],redownload=Fals
             continue
         print(f"Fetching signal peptides for proteome {proteomeId}...")
         baseUrl = "https://rest.uniprot.org/uniprotkb/stream?compressed=false&format=json&query=%s&fields=accession,id,ft_signal"
-        proteomes = f'(proteome:{" OR proteome:" .join(proteomeIds)})'
+        proteomes = f'(proteome:{proteomeId})'
         url = baseUrl % proteomes
         url = url.replace(" ", "%20")
-        # progress bar code
-        with urllib.request.urlopen(url) as response:
+        # stream response to disk; write to a temporary file so an interrupted
+        # download is not mistaken for a complete one on the next call
+        outPath = f"{basePath}{proteomeId}.json"
+        with urllib.request.urlopen(url) as response, open(f"{outPath}.part", 'wb') as outFile:
             total = response.getheader('Content-Length')
             total = int(total) if total else None
-            chunks = []
             with tqdm(total=total, unit='B', unit_scale=True, desc=f'Downloading {proteomeId}') as pbar:
-                while True:
-                    chunk = response.read(8192)
-                    if not chunk:
-                        break
-                    chunks.append(chunk)
+                while chunk := response.read(65536):
+                    outFile.write(chunk)
                     pbar.update(len(chunk))
-                    
-            content = b''.join(chunks).decode('utf-8')
-            
-        # save to file
-        with open(f"{basePath}{proteomeId}.json", 'w') as outFile:
-            outFile.write(content)
+        os.replace(f"{outPath}.part", outPath)
         
 
 def parseSignalPeptides(proteomeId):
     """
     Parse the signal peptide data for a given proteomeId from the corresponding JSON file
-    saved by getSignal(). Extracts and returns a dictionary mapping protein accessions to
+    saved by getSignal(). The file is parsed incrementally, so memory use scales with the
+    number of signal peptides rather than the size of the JSON dump. Extracts and returns a dictionary mapping protein accessions to
     their signal peptide start and end positions.
     proteomeId : str
         The UniProt proteome accession corresponding to the JSON file to parse
@@ -98,18 +91,16 @@ def parseSignalPeptides(proteomeId):
     """
     basePath = "data/signalProteomes/"
     signalPeptides = {"accession":{},"protein_name":{}}
-    with open(f"{basePath}{proteomeId}.json", 'r') as inFile:
-        data = json.load(inFile)
-        for entry in data['results']:
-            accession = entry['primaryAccession']
-            protein_name = entry['uniProtkbId']
-            features = entry.get('features', [])
-            for feature in features:
+    # Stream entries one at a time; ijson picks the C (yajl2_c) backend when available
+    with open(f"{basePath}{proteomeId}.json", 'rb') as inFile:
+        for entry in ijson.items(inFile, 'results.item'):
+            for feature in entry.get('features', ()):
                 if feature['type'] == 'Signal':
                     start = feature['location']['start']['value']
                     end = feature['location']['end']['value']
-                    signalPeptides["accession"][accession] = (start, end)
-                    signalPeptides["protein_name"][protein_name] = (start, end)
+                    signalPeptides["accession"][entry['primaryAccession']] = (start, end)
+                    signalPeptides["protein_name"][entry['uniProtkbId']] = (start, end)
+                    break  # UniProt annotates at most one signal peptide per entry
     return signalPeptides
 
 
@@ -12,26 +12,26 @@ with open(abundanceFile, 'r') as file:
         parts = line.strip().split('\t')
         if len(parts) == 2:
             header, abundance = parts
-            abundance_dict[header] = float(abundance)
+            abundance_dict[header.encode('ascii')] = f" AB={float(abundance)}\n".encode('ascii')
 
+missingSuffix = f" AB={0.0}\n".encode('ascii')
 
+# Headers look like b">sp|ACCESSION|ENTRYNAME description ... GN=GENE ..."; partition
+# returns a 3-tuple instead of building a full list of fields for every header.
+with open(baseProteome, 'rb') as fastaFile, open(abundanceProteome, 'wb') as outputFile:
+    for line in fastaFile:
+        if line.startswith(b'>'):
+            proteinIdentifier = None
+            header = line.partition(b"|")[2].partition(b"|")[2]
 
-    with open(baseProteome, 'r') as fastaFile, open(abundanceProteome, 'w') as outputFile:
-        for line in fastaFile:
-            if line.startswith('>'):
-                abundance = None
-                header = line.split("|")[2]
-                
-                if entryNameMode:
-                    proteinIdentifier = header.split(" ")[0]
-                else:
-                    if "GN=" in header:
-                        proteinIdentifier = header.split("GN=")[1].split(" ")[0]
-                    
-                abundance = abundance_dict.get(proteinIdentifier, None)
-                if abundance is not None:
-                    outputFile.write(f"{line.strip()} AB={abundance}\n")
-                else:
-                    outputFile.write(f"{line.strip()} AB={0.0}\n")
+            if entryNameMode:
+                proteinIdentifier = header.partition(b" ")[0]
             else:
-                outputFile.write(line)
\ No newline at end of file
+                _, geneTag, geneField = header.partition(b"GN=")
+                if geneTag:
+                    proteinIdentifier = geneField.partition(b" ")[0]
+
+            outputFile.write(line.strip())
+            outputFile.write(abundance_dict.get(proteinIdentifier, missingSuffix))
+        else:
+            outputFile.write(line)
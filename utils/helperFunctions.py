@@ -1,3 +1,79 @@
+class ModuleDefinitions(dict):
+    """
+    Merged module definitions ({moduleIdentifier: module JSON}) carrying their own flat
+    settings lookup used by extractSetting.
+    settingIndex : dict
+        (moduleIdentifier, settingName) -> (formtype, options), referring to the settings of
+        this dict. It is built once on construction; copy() duplicates it and adding,
+        replacing or removing a module updates only that module's entries. In-place edits
+        of a module's settings require calling reindex().
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reindex()
+
+    def reindex(self):
+        self.settingIndex = {}
+        for moduleIdentifier, module in self.items():
+            self.settingIndex.update(self.__settingEntries(moduleIdentifier, module))
+
+    def copy(self):
+        """
+        Shallow copy sharing the module dicts with this one; the index is copied, not rebuilt.
+        """
+        duplicate = ModuleDefinitions.__new__(ModuleDefinitions)
+        dict.update(duplicate, self)
+        duplicate.settingIndex = dict(self.settingIndex)
+        return duplicate
+
+    def __setitem__(self, moduleIdentifier, module):
+        entries = self.__settingEntries(moduleIdentifier, module)
+        if moduleIdentifier in self:
+            self.__unindexModule(moduleIdentifier, self[moduleIdentifier])
+        super().__setitem__(moduleIdentifier, module)
+        self.settingIndex.update(entries)
+
+    def __delitem__(self, moduleIdentifier):
+        self.__unindexModule(moduleIdentifier, self[moduleIdentifier])
+        super().__delitem__(moduleIdentifier)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, moduleIdentifier, *default):
+        if moduleIdentifier in self:
+            self.__unindexModule(moduleIdentifier, self[moduleIdentifier])
+        return super().pop(moduleIdentifier, *default)
+
+    def popitem(self):
+        moduleIdentifier, module = super().popitem()
+        self.__unindexModule(moduleIdentifier, module)
+        return moduleIdentifier, module
+
+    def clear(self):
+        super().clear()
+        self.settingIndex.clear()
+
+    def update(self, *args, **kwargs):
+        for moduleIdentifier, module in dict(*args, **kwargs).items():
+            self[moduleIdentifier] = module
+
+    def setdefault(self, moduleIdentifier, module):
+        if moduleIdentifier not in self:
+            self[moduleIdentifier] = module
+        return self[moduleIdentifier]
+
+    @staticmethod
+    def __settingEntries(moduleIdentifier, module):
+        return {(moduleIdentifier, settingName): (setting.get("formtype"), setting.get("options"))
+                for settingName, setting in module["settings"].items()}
+
+    def __unindexModule(self, moduleIdentifier, module):
+        for settingName in module["settings"]:
+            self.settingIndex.pop((moduleIdentifier, settingName), None)
+
+
 def extractSetting(settingName,moduleIdentifier,selectedSettings,moduleData):
     """
     Extract and convert a setting value from module data based on its field type.
@@ -23,36 +99,42 @@ def extractSetting(settingName,moduleIdentifier,selectedSettings,moduleData):
         If the specified setting name is not found in the module's settings configuration.
         If the setting's field type is not supported or recognized.
     """
-    currentModuleSettings = moduleData[moduleIdentifier]
-    settingsList = currentModuleSettings["settings"].get(settingName,None)
-    if settingsList is None:
-        raise ValueError(f"Failed to extract settings for module {moduleIdentifier} Setting: '{settingName}'. It was not found within current module settings. Valid options are : {list(currentModuleSettings['settings'].keys())}")
-    fieldType = settingsList.get("formtype",None)
-    match fieldType:
-        case "ChoiceField":
-            opts = currentModuleSettings["settings"][settingName]["options"]
-            selected = selectedSettings[settingName]
-
-            # If frontend posted the label
-            if selected in opts:
-                return opts[selected]
-
-            # If frontend posted the internal value already
-            if selected in opts.values():
-                return selected
-
-            raise KeyError(selected)
-
-        case "MultipleChoiceField":
-            return [currentModuleSettings["settings"][settingName]["options"][option] for option in selectedSettings[settingName]]
-        case "DecimalField":
-            return float(selectedSettings[settingName])
-        case "FileField":
-            return selectedSettings[settingName]
-        case "BooleanField":
-            return bool(selectedSettings.get(settingName,False))
-        case "CharField":
-            return str(selectedSettings[settingName])
-        case _:
-            raise NotImplementedError(f"Setting field type: {fieldType} was not found. Perhaps it was misspelled possible choices are: ChoiceField, MultipleChoiceField, DecimalField, FileField, BooleanField, CharField.")
-    
+    settingIndex = getattr(moduleData, "settingIndex", None)
+    indexedSetting = settingIndex.get((moduleIdentifier, settingName)) if settingIndex is not None else None
+    if indexedSetting is None:
+        # Plain dict (e.g. built outside the JSON loader) or unknown setting: resolve directly
+        currentModuleSettings = moduleData[moduleIdentifier]
+        settingsList = currentModuleSettings["settings"].get(settingName,None)
+        if settingsList is None:
+            raise ValueError(f"Failed to extract settings for module {moduleIdentifier} Setting: '{settingName}'. It was not found within current module settings. Valid options are : {list(currentModuleSettings['settings'].keys())}")
+        indexedSetting = (settingsList.get("formtype",None), settingsList.get("options",None))
+    fieldType, opts = indexedSetting
+    extractor = _SETTING_EXTRACTORS.get(fieldType)
+    if extractor is None:
+        raise NotImplementedError(f"Setting field type: {fieldType} was not found. Perhaps it was misspelled possible choices are: ChoiceField, MultipleChoiceField, DecimalField, FileField, BooleanField, CharField.")
+    return extractor(settingName, selectedSettings, opts)
+
+
+def _extractChoice(settingName, selectedSettings, opts):
+    selected = selectedSettings[settingName]
+
+    # If frontend posted the label
+    if selected in opts:
+        return opts[selected]
+
+    # If frontend posted the internal value already
+    if selected in opts.values():
+        return selected
+
+    raise KeyError(selected)
+
+
+# Field type -> converter(settingName, selectedSettings, options) used by extractSetting
+_SETTING_EXTRACTORS = {
+    "ChoiceField": _extractChoice,
+    "MultipleChoiceField": lambda settingName, selectedSettings, opts: [opts[option] for option in selectedSettings[settingName]],
+    "DecimalField": lambda settingName, selectedSettings, opts: float(selectedSettings[settingName]),
+    "FileField": lambda settingName, selectedSettings, opts: selectedSettings[settingName],
+    "BooleanField": lambda settingName, selectedSettings, opts: bool(selectedSettings.get(settingName,False)),
+    "CharField": lambda settingName, selectedSettings, opts: str(selectedSettings[settingName]),
+}
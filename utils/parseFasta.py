@@ -1,23 +1,55 @@
+import mmap
+import os
+import sys
+from collections import OrderedDict
 
-def readFile(filePath):
-    """Reads a file and returns its content.
+# Whitespace (line breaks included) deleted from sequence blocks
+_SEQUENCE_WHITESPACE = b'\n\r\t '
+
+# filePath -> (mtime_ns, size, sequences), least recently used first
+_FASTA_CACHE = OrderedDict()
+_FASTA_CACHE_MAX_FILES = 4
+
+
+def parseFasta(filePath):
+    """Parses a FASTA file and returns a dictionary of sequences.
+
+    Results are cached per file and reused as long as the file's modification time
+    and size are unchanged, so repeated requests for the same proteome skip all I/O
+    and parsing. The returned dictionary is shared between callers and must not be
+    modified.
 
     Parameters
     ----------
     filePath : str
-        The path to the file to be read.
+        The path to the FASTA file.
 
     Returns
     -------
-    str
-        The content of the file.
+    dict
+        A dictionary where the keys are sequence headers and the values are the corresponding sequences.
     """
-    with open(filePath, 'r') as file:
-        return file.read()
+    fileStat = os.stat(filePath)
+    fileVersion = (fileStat.st_mtime_ns, fileStat.st_size)
+    cached = _FASTA_CACHE.get(filePath)
+    if cached is not None and cached[:2] == fileVersion:
+        _FASTA_CACHE.move_to_end(filePath)
+        return cached[2]
+
+    sequences = _parseFastaFile(filePath)
+    _FASTA_CACHE[filePath] = (*fileVersion, sequences)
+    _FASTA_CACHE.move_to_end(filePath)
+    while len(_FASTA_CACHE) > _FASTA_CACHE_MAX_FILES:
+        _FASTA_CACHE.popitem(last=False)
+    return sequences
 
 
-def parseFasta(filePath):
-    """Parses a FASTA file and returns a dictionary of sequences.
+def _parseFastaFile(filePath):
+    """Parses a FASTA file from disk without caching.
+
+    The file is memory-mapped and scanned for record boundaries ('\n>') on the
+    raw bytes; each header and sequence is only decoded once it is stored, so the
+    file content is never copied into a single Python string.
 
     Parameters
     ----------
@@ -29,22 +61,31 @@ def parseFasta(filePath):
     dict
         A dictionary where the keys are sequence headers and the values are the corresponding sequences.
     """
-    fileContent = readFile(filePath)
     sequences = {}
-    current_header = None
-    current_sequence = []
-
-    for line in fileContent.splitlines():
-        line = line.strip()
-        if line.startswith('>'):
-            if current_header:
-                sequences[current_header] = ''.join(current_sequence)
-            current_header = line[1:]  # Remove '>'
-            current_sequence = []
-        else:
-            current_sequence.append(line)
-    else:
-        sequences[current_header] = ''.join(current_sequence)
+    with open(filePath, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return sequences
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            # Skip anything before the first header
+            if mm[:1] == b'>':
+                recordStart = 1
+            else:
+                firstRecord = mm.find(b'\n>')
+                recordStart = firstRecord + 2 if firstRecord != -1 else size + 1
+            while recordStart <= size:
+                recordEnd = mm.find(b'\n>', recordStart)
+                if recordEnd == -1:
+                    recordEnd = size
+                headerEnd = mm.find(b'\n', recordStart, recordEnd)
+                if headerEnd == -1:
+                    headerEnd = recordEnd
+                header = mm[recordStart:headerEnd].strip()
+                if header:
+                    sequence = mm[headerEnd + 1:recordEnd].translate(None, _SEQUENCE_WHITESPACE)
+                    # Interned so headers from repeated parses share one string object and compare by identity
+                    sequences[sys.intern(header.decode('utf-8'))] = sequence.decode('ascii')
+                recordStart = recordEnd + 2
 
     return sequences
 